@@ -2,52 +2,428 @@
 
 from __future__ import annotations
 
+import abc
+import hashlib
+import itertools
+import json
+import logging
+import os
+import random
+import sqlite3
+import sys
+import threading
 import time
 import typing as t
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlsplit
 
 import requests
-from singer_sdk.helpers.jsonpath import extract_jsonpath
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from singer_sdk.pagination import BaseAPIPaginator
 from singer_sdk.streams import RESTStream
+from singer_sdk import metrics
+from singer_sdk._singerlib.messages import RecordMessage, format_message
 from singer_sdk.exceptions import RetriableAPIError, FatalAPIError
 
-# 1000 req/hour limit; small delay to stay safe
-REQUEST_DELAY_SECONDS = 0.5
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to requests' stdlib json
+    orjson = None  # type: ignore[assignment]
+
+# 1000 req/hour limit; allow short bursts, then refill so that the burst
+# plus the refill stay within the hourly limit
+RATE_LIMIT_CAPACITY = 50
+RATE_LIMIT_PER_HOUR = 1000
+
+# Full-jitter backoff: random(0, min(cap, base * 2**attempt))
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_CAP_SECONDS = 240
+
+BASE_URL = "https://channeldock.com"
+
+RESPONSE_CACHE_PATH = os.path.join(".channeldock_cache", "responses.sqlite")
+# When a request still fails after its retries, an expired entry up to this
+# many TTLs old is served instead
+STALE_IF_ERROR_TTL_FACTOR = 10
 
 if t.TYPE_CHECKING:
     from singer_sdk.helpers.types import Context
 
 
+def _mount_adapter(session: requests.Session, pool_maxsize: int) -> None:
+    # Single host, so a single pool; retries are handled by the SDK backoff
+    # decorator, not urllib3
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=0)
+    session.mount(BASE_URL, adapter)
+
+
+def _build_session() -> requests.Session:
+    """Build a keep-alive session shared by every stream (single host)."""
+    session = requests.Session()
+    _mount_adapter(session, pool_maxsize=1)
+    session.headers.update(
+        {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+    )
+    return session
+
+
+_SESSION = _build_session()
+_SESSION_LOCK = threading.Lock()
+_pool_maxsize = 1
+
+
+def get_session(pool_maxsize: int = 1) -> requests.Session:
+    """Return the shared Channeldock session.
+
+    The connection pool grows to ``pool_maxsize`` so each page in flight keeps
+    its own keep-alive connection instead of opening and dropping extras.
+    """
+    global _pool_maxsize
+    with _SESSION_LOCK:
+        if pool_maxsize > _pool_maxsize:
+            _mount_adapter(_SESSION, pool_maxsize)
+            _pool_maxsize = pool_maxsize
+    return _SESSION
+
+
+class TokenBucket:
+    """Token-bucket rate limiter; blocks only when the bucket is empty."""
+
+    def __init__(self, capacity: float, refill_rate: float) -> None:
+        self.capacity = capacity
+        self.tokens = capacity
+        self.refill_rate = refill_rate
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.last_refill = now
+
+    def acquire(self, n: int = 1, stop: threading.Event | None = None) -> bool:
+        """Take ``n`` tokens; returns False, taking none, once ``stop`` is set."""
+        with self._lock:
+            if stop is not None and stop.is_set():
+                return False
+            self._refill()
+            if self.tokens < n:
+                wait = (n - self.tokens) / self.refill_rate
+                if stop is None:
+                    time.sleep(wait)
+                elif stop.wait(wait):
+                    return False
+                self._refill()
+            self.tokens -= n
+            return True
+
+
+# One bucket per API key, since the hourly limit is per account
+_BUCKETS: dict[str, TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def get_bucket(api_key: str) -> TokenBucket:
+    """Return the rate limiter shared by all streams using ``api_key``."""
+    with _BUCKETS_LOCK:
+        if api_key not in _BUCKETS:
+            _BUCKETS[api_key] = TokenBucket(
+                capacity=RATE_LIMIT_CAPACITY,
+                refill_rate=(RATE_LIMIT_PER_HOUR - RATE_LIMIT_CAPACITY) / 3600,
+            )
+        return _BUCKETS[api_key]
+
+
+class ResponseCache:
+    """On-disk TTL cache for GET responses, keyed by URL, params and api_key."""
+
+    def __init__(self, path: str, ttl: float) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, stored_at REAL, status INTEGER, "
+                "headers TEXT, content BLOB)"
+            )
+
+    @staticmethod
+    def key_for(request: requests.PreparedRequest, api_key: str) -> str:
+        url = urlsplit(request.url or "")
+        raw = json.dumps(
+            [
+                request.method,
+                f"{url.scheme}://{url.netloc}{url.path}",
+                sorted(parse_qsl(url.query)),
+                # Never share entries between accounts
+                hashlib.sha256(api_key.encode()).hexdigest(),
+            ]
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(
+        self,
+        key: str,
+        request: requests.PreparedRequest,
+        max_age: float | None = None,
+    ) -> requests.Response | None:
+        """Cached response, or None if missing or older than ``max_age`` (ttl)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, status, headers, content FROM responses "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        stored_at, status, headers, content = row
+        if time.time() - stored_at > (self.ttl if max_age is None else max_age):
+            return None
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response._content = content
+        response.url = request.url or ""
+        response.request = request
+        return response
+
+    def set(self, key: str, response: requests.Response) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    time.time(),
+                    response.status_code,
+                    json.dumps(dict(response.headers)),
+                    response.content,
+                ),
+            )
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as fresh again, e.g. after a 304 revalidation."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+    @staticmethod
+    def validators(response: requests.Response) -> dict[str, str]:
+        """Conditional request headers for revalidating a cached response."""
+        headers = {}
+        if "ETag" in response.headers:
+            headers["If-None-Match"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            headers["If-Modified-Since"] = response.headers["Last-Modified"]
+        return headers
+
+
+_RESPONSE_CACHES: dict[float, ResponseCache] = {}
+_RESPONSE_CACHES_LOCK = threading.Lock()
+
+
+def get_response_cache(ttl: float) -> ResponseCache:
+    """Return the shared response cache for ``ttl``."""
+    with _RESPONSE_CACHES_LOCK:
+        if ttl not in _RESPONSE_CACHES:
+            _RESPONSE_CACHES[ttl] = ResponseCache(RESPONSE_CACHE_PATH, ttl)
+        return _RESPONSE_CACHES[ttl]
+
+
+def _snippet(response: requests.Response, n: int = 200) -> str:
+    """First ``n`` bytes of the body, without decoding the whole of it."""
+    return response.content[:n].decode("utf-8", "replace")
+
+
+def _retry_after_seconds(response: requests.Response) -> float | None:
+    """Seconds to wait before retrying, from Retry-After or X-RateLimit-Reset."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+        try:
+            # HTTP-date form, e.g. "Wed, 21 Oct 2015 07:28:00 GMT"
+            return parsedate_to_datetime(retry_after).timestamp() - time.time()
+        except (TypeError, ValueError):
+            pass
+
+    reset_time = response.headers.get("X-RateLimit-Reset")
+    if reset_time:
+        try:
+            return int(reset_time) - int(time.time())
+        except (ValueError, TypeError):
+            pass
+    return None
+
+
+def _parse_json(response: requests.Response) -> t.Any:
+    """Decode a response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _dumps(value: t.Any) -> str:
+    """Serialize a nested field to compact JSON text, with orjson if installed."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    # Same text as orjson: compact separators and unescaped UTF-8
+    return json.dumps(value, default=str, separators=(",", ":"), ensure_ascii=False)
+
+
+def _message_default(value: t.Any) -> str:
+    # Decimals are left to the SDK encoder, which writes them as numbers
+    if isinstance(value, Decimal):
+        raise TypeError
+    return str(value)
+
+
+def _format_record_message(message: RecordMessage) -> str:
+    """format_message, with orjson if installed and the output is plain ASCII."""
+    if orjson is not None:
+        try:
+            # Datetimes go through str() as in the SDK encoder
+            text = orjson.dumps(
+                message.to_dict(),
+                default=_message_default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode()
+        except TypeError:
+            pass
+        else:
+            # The SDK escapes non-ASCII text, so that output suits any stdout
+            # encoding; keep its output for those records
+            if text.isascii():
+                return text
+    return format_message(message)
+
+
+# Exact types, as produced by the JSON decoder; no subclass check needed
+_JSON_CONTAINER_TYPES = (list, dict)
+
+
+@lru_cache(maxsize=4096)
+def _dumps_str_list(values: tuple[str, ...]) -> str:
+    return _dumps(list(values))
+
+
+def _dumps_cached(value: t.Any) -> str:
+    """_dumps, memoized for lists of strings (tags repeat across products)."""
+    if type(value) is list and all(type(item) is str for item in value):
+        return _dumps_str_list(tuple(value))
+    return _dumps(value)
+
+
+@lru_cache(maxsize=None)
+def _cached_schema(stream_class: type[ChanneldockStream]) -> dict:
+    return stream_class._build_schema()
+
+
+def _response_json(response: requests.Response) -> t.Any:
+    """Decode the response body once; parse_response and the paginator share it."""
+    data = getattr(response, "_cd_parsed", None)
+    if data is None:
+        data = _parse_json(response)
+        response._cd_parsed = data  # type: ignore[attr-defined]
+    return data
+
+
+class _PageDiscarded(Exception):
+    """Raised to stop retrying a prefetched page that is no longer needed."""
+
+
+def _is_records_page(response: requests.Response) -> bool:
+    """Whether the body is a page of records rather than an API error."""
+    try:
+        data = _response_json(response)
+    except ValueError:
+        return False
+    return isinstance(data, dict) and data.get("response") != "error"
+
+
 class ChanneldockPaginator(BaseAPIPaginator[int]):
-    """Page-based paginator for Channeldock API."""
+    """Page-based paginator for Channeldock API.
+
+    A page shorter than ``page_size`` is the last one. When the page size was
+    requested through ``per_page`` (``verify_page_size``) the API may cap it
+    lower, so until a full page confirms the size, a short page is followed
+    by one more request and only an empty page ends pagination.
+    """
 
     PAGE_SIZE = 50
 
-    def __init__(self, start_value: int = 1) -> None:
+    def __init__(
+        self,
+        records_key: str,
+        start_value: int = 1,
+        page_size: int = PAGE_SIZE,
+        verify_page_size: bool = False,
+        logger: logging.Logger | None = None,
+    ) -> None:
         super().__init__(start_value)
         self._page = start_value
+        self._page_size = page_size
+        self._page_size_confirmed = not verify_page_size
+        self._short_page_length: int | None = None
+        self._records_key = records_key
+        self._count_key = f"{records_key}_count"
+        self._logger = logger or logging.getLogger(__name__)
 
     def get_next(self, response: requests.Response) -> int | None:
         """Resolve next page from response. Works with any endpoint (products, suppliers, etc.)."""
         try:
-            data = response.json()
+            data = _response_json(response)
         except Exception:
             return None
-        
+
         if not isinstance(data, dict):
             return None
 
         # API uses {entity}_count + {entity} array (e.g. products_count/products)
-        records_count = 0
-        records_list = []
-        
-        for key in data:
-            if key.endswith("_count") and isinstance(data[key], int):
-                records_count = data[key]
-            elif isinstance(data[key], list) and key not in ("response", "page", "page_size"):
-                records_list = data[key]
+        records_count = data.get(self._count_key) or 0
+        records_list = data.get(self._records_key) or []
 
-        if records_count == 0 or len(records_list) < self.PAGE_SIZE:
+        if records_count == 0 or not records_list:
+            return None
+
+        if not self._page_size_confirmed:
+            if self._short_page_length is not None:
+                # More records after a short page: per_page is capped (or
+                # ignored) and the short page was a full one
+                self._logger.warning(
+                    "API returned %s records per page instead of the configured "
+                    "page_size of %s; paginating with %s",
+                    self._short_page_length,
+                    self._page_size,
+                    self._short_page_length,
+                )
+                self._page_size = self._short_page_length
+                self._page_size_confirmed = True
+            elif len(records_list) >= self._page_size:
+                self._page_size_confirmed = True
+            else:
+                # Either the last page or a capped page size; the next page
+                # tells which
+                self._short_page_length = len(records_list)
+                self._page += 1
+                return self._page
+
+        if len(records_list) < self._page_size:
             return None
 
         self._page += 1
@@ -57,125 +433,438 @@ class ChanneldockPaginator(BaseAPIPaginator[int]):
 class ChanneldockStream(RESTStream[int]):
     """Base Channeldock stream class with common functionality."""
 
-    records_jsonpath: str = "$[*]"
+    # Top-level key holding the page's records, e.g. "products"
+    records_key: str
     page_size: int = 50
+    # Static query params sent with every page
+    _BASE_PARAMS: t.ClassVar[dict[str, t.Any]] = {}
+    # Nested list/dict fields emitted as JSON strings, see post_process
+    _json_fields: tuple[str, ...] = ()
+    # Whether get_url_params sends _get_end_date() as an upper bound. Only
+    # then can the bookmark be capped at it (the replication signpost).
+    _sends_end_date: bool = False
     replication_key: str | None = None
     replication_method: str = "FULL_TABLE"
+    # Emit STATE every 10k records (plus at stream end) rather than
+    # relying on the SDK default staying at that value
+    STATE_MSG_FREQUENCY = 10000
 
     @property
     def url_base(self) -> str:
-        return "https://channeldock.com"
+        return BASE_URL
 
     @property
-    def http_headers(self) -> dict[str, str]:
-        return {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
+    def requests_session(self) -> requests.Session:
+        # Reuse pooled TLS connections across pages and streams
+        return get_session(pool_maxsize=self.config.get("max_concurrency") or 1)
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Built once; Content-Type/Accept are set on the shared session
+        self._cached_headers: dict[str, str] = {
             "api_key": self.config["api_key"],
             "api_secret": self.config["api_secret"],
         }
+        start_date = self.config.get("start_date")
+        # API filters on the date part only
+        self._date_from: str | None = start_date.split("T")[0] if start_date else None
+        self._current_end_date: str | None = None
+        self._cached_bookmark: t.Any | None = None
+        self._bookmark_computed = False
+        # Set in prefetch worker threads only, see request_records
+        self._worker_state = threading.local()
+        # Static params plus per_page, which is only sent when configured;
+        # otherwise the API default page size applies
+        self._static_params: dict[str, t.Any] = dict(self._BASE_PARAMS)
+        page_size = self.config.get("page_size")
+        if page_size:
+            self.page_size = page_size
+            self._static_params["per_page"] = page_size
+
+    @property
+    def http_headers(self) -> dict[str, str]:
+        return self._cached_headers
+
+    @property
+    def schema(self) -> dict:
+        # Built on first use and shared by every instance of the stream class
+        return _cached_schema(type(self))
+
+    @classmethod
+    @abc.abstractmethod
+    def _build_schema(cls) -> dict:
+        """Build the stream's JSON schema; see the schema property."""
 
     def get_new_paginator(self) -> ChanneldockPaginator:
-        return ChanneldockPaginator(start_value=1)
+        return ChanneldockPaginator(
+            self.records_key,
+            start_value=1,
+            page_size=self.page_size,
+            verify_page_size=bool(self.config.get("page_size")),
+            logger=self.logger,
+        )
 
     def get_url_params(
         self,
         context: Context | None,
         next_page_token: int | None,
     ) -> dict[str, t.Any]:
-        params: dict[str, t.Any] = {
-            "page": next_page_token or 1,
-        }
+        params = dict(self._static_params)
+        params["page"] = next_page_token or 1
+
+        if self._date_from and self.replication_key:
+            params["date_from"] = self._date_from
 
-        start_date = self.config.get("start_date")
-        if start_date and self.replication_key:
-            date_part = start_date.split("T")[0] if "T" in start_date else start_date
-            params["date_from"] = date_part
-            
         return params
 
+    def _get_end_date(self) -> str:
+        """Upper bound of the sync window, fixed for every page of a sync."""
+        if self._current_end_date is None:
+            self._current_end_date = self._utcnow_str()
+        return self._current_end_date
+
+    @staticmethod
+    def _utcnow_str() -> str:
+        """Current UTC time as "YYYY-MM-DD HH:MM:SS", the API's date format."""
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+
+    def get_replication_key_signpost(
+        self,
+        context: Context | None = None,
+    ) -> str | None:
+        # Records updated after the end date are still emitted by streams
+        # that don't send it, so their bookmarks must not be capped there
+        if not self._sends_end_date:
+            return None
+        return self._current_end_date
+
+    def _start_sync_window(self, context: Context | None) -> None:
+        """Start a new sync window; called once at the start of each sync.
+
+        sync() asks for the signpost before the window exists, so it is
+        written here instead, before the first record moves the bookmark.
+        """
+        self._current_end_date = None
+        self._cached_bookmark = None
+        self._bookmark_computed = False
+        if self.replication_key and self._sends_end_date:
+            self._write_replication_key_signpost(context, self._get_end_date())
+
+    def _get_bookmark(self, context: Context | None) -> t.Any | None:
+        """Starting replication value, read from state once per sync."""
+        if not self._bookmark_computed:
+            self._cached_bookmark = self.get_starting_replication_key_value(context)
+            self._bookmark_computed = True
+        return self._cached_bookmark
+
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """Response cache, only for FULL_TABLE streams and when a TTL is set.
+
+        Incremental streams are never cached so bookmarks can't go stale.
+        """
+        ttl = self.config.get("response_cache_ttl")
+        if not ttl or self.replication_method != "FULL_TABLE":
+            return None
+        return get_response_cache(ttl)
+
+    def _request(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: Context | None,
+    ) -> requests.Response:
+        cache = self.response_cache if prepared_request.method == "GET" else None
+        if cache is None:
+            return self._send(prepared_request, context)
+
+        cache_key = cache.key_for(prepared_request, self.config["api_key"])
+        cached = cache.get(cache_key, prepared_request)
+        if cached is not None:
+            self.logger.debug("[%s] Cache hit: %s", self.name, prepared_request.url)
+            return cached
+
+        # An expired entry is revalidated rather than downloaded again when
+        # the API sent an ETag or Last-Modified with it
+        stale = cache.get(cache_key, prepared_request, max_age=float("inf"))
+        if stale is not None:
+            prepared_request.headers.update(cache.validators(stale))
+
+        response = self._send(prepared_request, context)
+        if response.status_code == 304 and stale is not None:
+            self.logger.debug("[%s] Not modified: %s", self.name, prepared_request.url)
+            cache.touch(cache_key)
+            return stale
+
+        # A 200 can still carry {"response": "error"}; never replay those
+        if response.status_code == 200 and _is_records_page(response):
+            cache.set(cache_key, response)
+        return response
+
+    def _request_or_stale(
+        self,
+        decorated_request: t.Callable,
+        prepared_request: requests.PreparedRequest,
+        context: Context | None,
+    ) -> requests.Response:
+        """Send with retries; if they all fail, serve a recently expired entry."""
+        try:
+            return decorated_request(prepared_request, context)
+        except (
+            RetriableAPIError,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.ReadTimeout,
+        ):
+            cache = self.response_cache if prepared_request.method == "GET" else None
+            if cache is None:
+                raise
+            stale = cache.get(
+                cache.key_for(prepared_request, self.config["api_key"]),
+                prepared_request,
+                max_age=cache.ttl * STALE_IF_ERROR_TTL_FACTOR,
+            )
+            if stale is None:
+                raise
+            self.logger.warning(f"[{self.name}] Request failed, serving stale cache")
+            return stale
+
+    def _send(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: Context | None,
+    ) -> requests.Response:
+        # Checked before every attempt, so discarded pages stop retrying
+        if self._prefetch_stopped():
+            raise _PageDiscarded(prepared_request.url)
+        # Take a token before every send, including backoff retries. A page
+        # discarded while waiting for one is not sent.
+        stop = getattr(self._worker_state, "stop", None)
+        bucket = get_bucket(self.config["api_key"])
+        if not bucket.acquire(stop=stop) or self._prefetch_stopped():
+            raise _PageDiscarded(prepared_request.url)
+        return super()._request(prepared_request, context)
+
+    def request_records(self, context: Context | None) -> t.Iterable[dict]:
+        """Request pages, prefetching up to ``max_concurrency`` pages ahead.
+
+        Pages are numbered, so the next ones can be requested before the
+        current one is parsed. Page 1 is fetched on its own first, so
+        single-page syncs (typical incremental deltas) send no speculative
+        requests. Records are still yielded in page order, so bookmarks
+        advance exactly as in a serial sync.
+        """
+        self._start_sync_window(context)
+        max_concurrency = self.config.get("max_concurrency") or 1
+        if max_concurrency > 1:
+            yield from self._request_records_concurrently(context, max_concurrency)
+            return
+
+        # As in the SDK, plus the per-page flush
+        paginator = self.get_new_paginator()
+        decorated_request = self.request_decorator(self._request)
+
+        with metrics.http_request_counter(self.name, self.path) as request_counter:
+            request_counter.context = context
+
+            while not paginator.finished:
+                prepared_request = self.prepare_request(
+                    context,
+                    next_page_token=paginator.current_value,
+                )
+                resp = self._request_or_stale(
+                    decorated_request, prepared_request, context
+                )
+                request_counter.increment()
+                self.update_sync_costs(prepared_request, resp, context)
+                yield from self.parse_response(resp)
+                # Every record of the page has been written by now; see
+                # _write_record_message
+                sys.stdout.flush()
+
+                paginator.advance(resp)
+
+    def _request_records_concurrently(
+        self,
+        context: Context | None,
+        max_concurrency: int,
+    ) -> t.Iterable[dict]:
+        paginator = self.get_new_paginator()
+        decorated_request = self.request_decorator(self._request)
+        pending: deque = deque()
+        next_page = paginator.current_value
+        window = 1
+        # Set once the pages still in flight are no longer needed
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            initializer=self._init_prefetch_worker,
+            initargs=(stop,),
+        )
+
+        try:
+            with metrics.http_request_counter(self.name, self.path) as request_counter:
+                request_counter.context = context
+
+                while not paginator.finished:
+                    while len(pending) < window:
+                        # Prepared in this thread; only the sends run in workers
+                        prepared_request = self.prepare_request(
+                            context, next_page_token=next_page
+                        )
+                        future = executor.submit(
+                            self._request_or_stale,
+                            decorated_request,
+                            prepared_request,
+                            context,
+                        )
+                        pending.append((prepared_request, future))
+                        next_page += 1
+
+                    prepared_request, future = pending.popleft()
+                    resp = future.result()
+                    request_counter.increment()
+                    self.update_sync_costs(prepared_request, resp, context)
+                    yield from self.parse_response(resp)
+                    sys.stdout.flush()
+
+                    paginator.advance(resp)
+                    window = max_concurrency
+        finally:
+            # Pages past the last one, or left over after an error, are
+            # discarded: queued ones are cancelled, running ones stop at their
+            # next attempt or sleep, and this sync does not wait for them
+            stop.set()
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _init_prefetch_worker(self, stop: threading.Event) -> None:
+        self._worker_state.stop = stop
+
+    def _prefetch_stopped(self) -> bool:
+        stop = getattr(self._worker_state, "stop", None)
+        return stop is not None and stop.is_set()
+
+    def _sleep(self, seconds: float) -> None:
+        """time.sleep, cut short when a prefetched page is discarded."""
+        stop = getattr(self._worker_state, "stop", None)
+        if stop is None:
+            time.sleep(seconds)
+        else:
+            stop.wait(seconds)
+
     def parse_response(self, response: requests.Response) -> t.Iterable[dict]:
         try:
-            data = response.json()
-        except requests.exceptions.JSONDecodeError:
-            self.logger.error(f"Failed to decode JSON response: {response.text[:500]}")
+            data = _response_json(response)
+        except ValueError:  # stdlib, requests and orjson decode errors
+            self.logger.error(
+                f"Failed to decode JSON response: {_snippet(response, 500)}"
+            )
             return
 
-        if isinstance(data, dict):
-            if data.get("response") == "error":
-                self.logger.error(f"API error: {data.get('message', 'Unknown error')}")
-                return
+        if not isinstance(data, dict):
+            self.logger.error(f"Unexpected response body: {_snippet(response, 500)}")
+            return
 
-        records = list(extract_jsonpath(self.records_jsonpath, input=data))
-        products_count = data.get("products_count", len(records)) if isinstance(data, dict) else len(records)
-        self.logger.info(f"Page returned {products_count} records")
-        
-        yield from records
+        if data.get("response") == "error":
+            self.logger.error(f"API error: {data.get('message', 'Unknown error')}")
+            return
+
+        # Log the API's own count rather than buffering the page to count it
+        records_count = data.get(f"{self.records_key}_count", "unknown")
+        self.logger.info("Page returned %s records", records_count)
+
+        # Empty rows are dropped here, before the SDK's per-record processing
+        for record in data.get(self.records_key) or ():
+            if record:
+                yield record
+
+    def post_process(
+        self,
+        row: dict,
+        context: Context | None = None,
+    ) -> dict | None:
+        # Only arrays/objects are encoded; scalars (e.g. a supplier given as a
+        # plain name) pass through unchanged and missing fields become None
+        dumps = _dumps_cached
+        for field in self._json_fields:
+            value = row.get(field)
+            if type(value) in _JSON_CONTAINER_TYPES:
+                row[field] = dumps(value)
+            else:
+                row.setdefault(field, None)
+
+        return row
+
+    def _write_record_message(self, record: dict) -> None:
+        # As in the SDK, but without flushing stdout after every record.
+        # Output is flushed once per page by request_records and by every
+        # STATE message.
+        for record_message in self._generate_record_messages(record):
+            sys.stdout.write(_format_record_message(record_message) + "\n")
+
+        self._is_state_flushed = False
 
     def validate_response(self, response: requests.Response) -> None:
         """Validate response, enforce rate limits, and raise RetriableAPIError/FatalAPIError."""
-        time.sleep(REQUEST_DELAY_SECONDS)
         rate_limit_remaining = response.headers.get("X-RateLimit-Remaining")
         rate_limit_reset = response.headers.get("X-RateLimit-Reset")
         
         if rate_limit_remaining:
             remaining = int(rate_limit_remaining)
             self.logger.debug(
-                f"Rate limit: {remaining} remaining, resets at {rate_limit_reset}"
+                "Rate limit: %s remaining, resets at %s", remaining, rate_limit_reset
             )
-            if remaining < 100:
-                self.logger.warning(f"Rate limit low ({remaining} remaining). Slowing down...")
-                time.sleep(5)  # Wait 5 seconds
-            elif remaining < 50:
+            # Check the critical threshold first; it is a subset of the low one
+            if remaining < 50:
                 self.logger.warning(f"Rate limit critical ({remaining} remaining). Waiting longer...")
-                time.sleep(30)
+                self._sleep(30)
+            elif remaining < 100:
+                self.logger.warning(f"Rate limit low ({remaining} remaining). Slowing down...")
+                self._sleep(5)  # Wait 5 seconds
 
         if response.status_code == 429:
-            reset_time = response.headers.get("X-RateLimit-Reset")
-            if reset_time:
-                try:
-                    wait_seconds = int(reset_time) - int(time.time())
-                    if wait_seconds > 0:
-                        actual_wait = min(wait_seconds, 3600)  # cap at 60 min
-                        minutes = actual_wait // 60
-                        self.logger.warning(
-                            f"Rate limit exceeded. Waiting {minutes} minutes ({actual_wait}s)..."
-                        )
-                        time.sleep(actual_wait)
-                except (ValueError, TypeError):
-                    time.sleep(60)
-            else:
-                time.sleep(60)
-            
+            wait_seconds = _retry_after_seconds(response)
+            if wait_seconds is None:
+                self._sleep(60)
+            elif wait_seconds > 0:
+                actual_wait = min(wait_seconds, 3600)  # cap at 60 min
+                minutes = int(actual_wait // 60)
+                self.logger.warning(
+                    f"Rate limit exceeded. Waiting {minutes} minutes "
+                    f"({actual_wait:.0f}s)..."
+                )
+                self._sleep(actual_wait)
+
             raise RetriableAPIError(
-                f"Rate limit exceeded: {response.text[:200]}"
+                f"Rate limit exceeded: {_snippet(response)}"
             )
 
         if 500 <= response.status_code < 600:
             raise RetriableAPIError(
                 f"{response.status_code} Server Error: {response.reason} "
-                f"for path: {self.path} - {response.text[:200]}"
+                f"for path: {self.path} - {_snippet(response)}"
             )
 
         if 400 <= response.status_code < 500:
             raise FatalAPIError(
                 f"{response.status_code} Client Error: {response.reason} "
-                f"for path: {self.path} - {response.text[:200]}"
+                f"for path: {self.path} - {_snippet(response)}"
             )
 
-    def post_process(
-        self,
-        row: dict,
-        context: Context | None = None,
-    ) -> dict | None:
-        if not row:
-            return None
-        return row
+    def backoff_wait_generator(self) -> t.Generator[float, None, None]:
+        # backoff primes the generator with send(None) before the first wait
+        yield  # type: ignore[misc]
+        for attempt in itertools.count():
+            ceiling = min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
+            yield random.uniform(0, ceiling)
 
-    def backoff_wait_generator(self) -> t.Iterator[float]:
-        # 30s, 60s, 120s, 240s (matches Channeldock webhook retry)
-        wait_times = [30, 60, 120, 240]
-        for wait_time in wait_times:
-            yield wait_time
-        while True:
-            yield 240
+    def backoff_jitter(self, value: float) -> float:
+        # Jitter is already applied by backoff_wait_generator. backoff sleeps
+        # with time.sleep, which can't be interrupted, so workers wait here
+        # instead: a discarded page stops waiting at once and its next
+        # attempt raises _PageDiscarded.
+        stop = getattr(self._worker_state, "stop", None)
+        if stop is None:
+            return value
+        stop.wait(value)
+        return 0
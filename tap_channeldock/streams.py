@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-import json
 import typing as t
-from datetime import datetime, timezone
 
 from singer_sdk import typing as th
 
@@ -14,6 +12,46 @@ if t.TYPE_CHECKING:
     from singer_sdk.helpers.types import Context
 
 
+_BILLING_ADDRESS_FIELDS = (
+    "first_name",
+    "middle_name",
+    "last_name",
+    "company",
+    "street",
+    "address1",
+    "address2",
+    "address_supplement",
+    "house_number",
+    "house_number_ext",
+    "city",
+    "region",
+    "zip_code",
+    "country_code",
+    "email",
+)
+_SHIPPING_ADDRESS_FIELDS = (
+    "first_name",
+    "last_name",
+    "company",
+    "street",
+    "address1",
+    "address2",
+    "house_number",
+    "house_number_ext",
+    "city",
+    "region",
+    "zip_code",
+    "country_code",
+    "email",
+    "phone_number",
+)
+
+
+def _address_properties(prefix: str, fields: tuple[str, ...]) -> list[th.Property]:
+    """String properties for an order address block, e.g. billing_city."""
+    return [th.Property(f"{prefix}_{field}", th.StringType) for field in fields]
+
+
 class ProductsStream(ChanneldockStream):
     """Products stream with stocking_date incremental sync."""
 
@@ -22,41 +60,47 @@ class ProductsStream(ChanneldockStream):
     primary_keys = ["id"]
     replication_key = "stocking_date"
     replication_method = "INCREMENTAL"
-    records_jsonpath = "$.products[*]"
-
-    _current_end_date: str | None = None
-
-    schema = th.PropertiesList(
-        th.Property("id", th.IntegerType, required=True),
-        th.Property("ean", th.StringType),
-        th.Property("sku", th.StringType),
-        th.Property("title", th.StringType),
-        th.Property("img_url", th.StringType),
-        th.Property("product_reference", th.StringType),
-        th.Property("stock", th.IntegerType),
-        th.Property("available_stock", th.IntegerType),
-        th.Property("total_lvb_stock", th.IntegerType),
-        th.Property("total_fba_stock", th.IntegerType),
-        th.Property("total_fbc_stock", th.IntegerType),
-        th.Property("x_size", th.IntegerType),
-        th.Property("y_size", th.IntegerType),
-        th.Property("z_size", th.IntegerType),
-        th.Property("weight", th.NumberType),
-        th.Property("price", th.NumberType),
-        th.Property("purchase_price", th.NumberType),
-        th.Property("supplier_id", th.IntegerType),
-        th.Property("minimal_supplier_order_quantity", th.IntegerType),
-        th.Property("replenishment_time", th.IntegerType),
-        th.Property("stock_advice_iron_stock", th.IntegerType),
-        th.Property("units_per_box", th.IntegerType),
-        th.Property("sold_per_day", th.NumberType),
-        th.Property("is_bundle_product", th.IntegerType),
-        th.Property("require_serial_number", th.IntegerType),
-        th.Property("stocking_date", th.DateTimeType),
-        th.Property("updated_at", th.DateTimeType),
-        th.Property("tags", th.StringType),
-        th.Property("child_products", th.StringType),
-    ).to_dict()
+    records_key = "products"
+    _json_fields = ("tags", "child_products")
+    _sends_end_date = True
+    # The bookmark is already filtered server-side (start_date/end_date),
+    # so incremental runs only page through the delta. ASC keeps page
+    # boundaries stable while paging and lets bookmarks advance in order.
+    _BASE_PARAMS = {"sort_attr": "stocking_date", "sort_dir": "ASC"}
+
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return th.PropertiesList(
+            th.Property("id", th.IntegerType, required=True),
+            th.Property("ean", th.StringType),
+            th.Property("sku", th.StringType),
+            th.Property("title", th.StringType),
+            th.Property("img_url", th.StringType),
+            th.Property("product_reference", th.StringType),
+            th.Property("stock", th.IntegerType),
+            th.Property("available_stock", th.IntegerType),
+            th.Property("total_lvb_stock", th.IntegerType),
+            th.Property("total_fba_stock", th.IntegerType),
+            th.Property("total_fbc_stock", th.IntegerType),
+            th.Property("x_size", th.IntegerType),
+            th.Property("y_size", th.IntegerType),
+            th.Property("z_size", th.IntegerType),
+            th.Property("weight", th.NumberType),
+            th.Property("price", th.NumberType),
+            th.Property("purchase_price", th.NumberType),
+            th.Property("supplier_id", th.IntegerType),
+            th.Property("minimal_supplier_order_quantity", th.IntegerType),
+            th.Property("replenishment_time", th.IntegerType),
+            th.Property("stock_advice_iron_stock", th.IntegerType),
+            th.Property("units_per_box", th.IntegerType),
+            th.Property("sold_per_day", th.NumberType),
+            th.Property("is_bundle_product", th.IntegerType),
+            th.Property("require_serial_number", th.IntegerType),
+            th.Property("stocking_date", th.DateTimeType),
+            th.Property("updated_at", th.DateTimeType),
+            th.Property("tags", th.StringType),
+            th.Property("child_products", th.StringType),
+        ).to_dict()
 
     def get_url_params(
         self,
@@ -64,42 +108,18 @@ class ProductsStream(ChanneldockStream):
         next_page_token: int | None,
     ) -> dict[str, t.Any]:
         params = super().get_url_params(context, next_page_token)
-        params["sort_attr"] = "stocking_date"
-        params["sort_dir"] = "ASC"
 
-        bookmark_value = self.get_starting_replication_key_value(context)
+        bookmark_value = self._get_bookmark(context)
         if bookmark_value:
             params["start_date"] = bookmark_value
-            self.logger.info(f"[{self.name}] start_date: {bookmark_value}")
+            self.logger.info("[%s] start_date: %s", self.name, bookmark_value)
 
-        self._current_end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        params["end_date"] = self._current_end_date
-        self.logger.info(f"[{self.name}] end_date: {self._current_end_date}")
+        end_date = self._get_end_date()
+        params["end_date"] = end_date
+        self.logger.info("[%s] end_date: %s", self.name, end_date)
 
         return params
 
-    def post_process(
-        self,
-        row: dict,
-        context: Context | None = None,
-    ) -> dict | None:
-        if not row:
-            return None
-
-        for field in ["tags", "child_products"]:
-            if field in row and isinstance(row[field], (list, dict)):
-                row[field] = json.dumps(row[field])
-            elif field not in row:
-                row[field] = None
-
-        return row
-
-    def get_replication_key_signpost(
-        self,
-        context: Context | None = None,
-    ) -> str | None:
-        return self._current_end_date
-
 
 class SuppliersStream(ChanneldockStream):
     """Suppliers stream (full table sync)."""
@@ -109,34 +129,28 @@ class SuppliersStream(ChanneldockStream):
     primary_keys = ["id"]
     replication_key = None
     replication_method = "FULL_TABLE"
-    records_jsonpath = "$.suppliers[*]"
-
-    schema = th.PropertiesList(
-        th.Property("id", th.IntegerType, required=True),
-        th.Property("firstname", th.StringType),
-        th.Property("lastname", th.StringType),
-        th.Property("company", th.StringType),
-        th.Property("phone", th.StringType),
-        th.Property("email", th.StringType),
-        th.Property("address1", th.StringType),
-        th.Property("address2", th.StringType),
-        th.Property("city", th.StringType),
-        th.Property("state", th.StringType),
-        th.Property("zipcode", th.StringType),
-        th.Property("country", th.StringType),
-        th.Property("payment_term", th.IntegerType),
-        th.Property("website", th.StringType),
-        th.Property("vat", th.IntegerType),
-        th.Property("vat_number", th.StringType),
-    ).to_dict()
-
-    def get_url_params(
-        self,
-        context: Context | None,
-        next_page_token: int | None,
-    ) -> dict[str, t.Any]:
-        """Return pagination params."""
-        return {"page": next_page_token or 1}
+    records_key = "suppliers"
+
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return th.PropertiesList(
+            th.Property("id", th.IntegerType, required=True),
+            th.Property("firstname", th.StringType),
+            th.Property("lastname", th.StringType),
+            th.Property("company", th.StringType),
+            th.Property("phone", th.StringType),
+            th.Property("email", th.StringType),
+            th.Property("address1", th.StringType),
+            th.Property("address2", th.StringType),
+            th.Property("city", th.StringType),
+            th.Property("state", th.StringType),
+            th.Property("zipcode", th.StringType),
+            th.Property("country", th.StringType),
+            th.Property("payment_term", th.IntegerType),
+            th.Property("website", th.StringType),
+            th.Property("vat", th.IntegerType),
+            th.Property("vat_number", th.StringType),
+        ).to_dict()
 
 
 class OrdersStream(ChanneldockStream):
@@ -147,110 +161,65 @@ class OrdersStream(ChanneldockStream):
     primary_keys = ["id"]
     replication_key = "updated_at"
     replication_method = "INCREMENTAL"
-    records_jsonpath = "$.orders[*]"
-
-    _current_end_date: str | None = None
-
-    schema = th.PropertiesList(
-        th.Property("id", th.IntegerType, required=True),
-        th.Property("seller_id", th.IntegerType),
-        th.Property("order_id", th.StringType),
-        th.Property("seq_order_id", th.StringType),
-        th.Property("channel_name", th.StringType),
-        th.Property("channel_id", th.IntegerType),
-        th.Property("api_id", th.IntegerType),
-        th.Property("payment_id", th.StringType),
-        th.Property("price_total", th.NumberType),
-        th.Property("price_currency", th.StringType),
-        th.Property("discount_total", th.NumberType),
-        th.Property("vat_number", th.StringType),
-        th.Property("total_weight", th.NumberType),
-        th.Property("billing_first_name", th.StringType),
-        th.Property("billing_middle_name", th.StringType),
-        th.Property("billing_last_name", th.StringType),
-        th.Property("billing_company", th.StringType),
-        th.Property("billing_street", th.StringType),
-        th.Property("billing_address1", th.StringType),
-        th.Property("billing_address2", th.StringType),
-        th.Property("billing_address_supplement", th.StringType),
-        th.Property("billing_house_number", th.StringType),
-        th.Property("billing_house_number_ext", th.StringType),
-        th.Property("billing_city", th.StringType),
-        th.Property("billing_region", th.StringType),
-        th.Property("billing_zip_code", th.StringType),
-        th.Property("billing_country_code", th.StringType),
-        th.Property("billing_email", th.StringType),
-        th.Property("shipping_first_name", th.StringType),
-        th.Property("shipping_last_name", th.StringType),
-        th.Property("shipping_company", th.StringType),
-        th.Property("shipping_street", th.StringType),
-        th.Property("shipping_address1", th.StringType),
-        th.Property("shipping_address2", th.StringType),
-        th.Property("shipping_house_number", th.StringType),
-        th.Property("shipping_house_number_ext", th.StringType),
-        th.Property("shipping_city", th.StringType),
-        th.Property("shipping_region", th.StringType),
-        th.Property("shipping_zip_code", th.StringType),
-        th.Property("shipping_country_code", th.StringType),
-        th.Property("shipping_email", th.StringType),
-        th.Property("shipping_phone_number", th.StringType),
-        th.Property("shipping_service", th.StringType),
-        th.Property("order_status", th.StringType),
-        th.Property("order_date", th.DateTimeType),
-        th.Property("ship_on_date", th.BooleanType),
-        th.Property("sync_date", th.DateTimeType),
-        th.Property("updated_at", th.DateTimeType),
-        th.Property("batch_id", th.IntegerType),
-        th.Property("batch_title", th.StringType),
-        th.Property("packaging_id", th.IntegerType),
-        th.Property("order_products", th.StringType),
-        th.Property("extra_comment", th.StringType),
-    ).to_dict()
+    records_key = "orders"
+    _json_fields = ("order_products",)
+    _sends_end_date = True
+    _BASE_PARAMS = {
+        "order_status": "ALL",
+        "sort_attr": "updated_at",
+        "sort_dir": "asc",
+    }
+
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return th.PropertiesList(
+            th.Property("id", th.IntegerType, required=True),
+            th.Property("seller_id", th.IntegerType),
+            th.Property("order_id", th.StringType),
+            th.Property("seq_order_id", th.StringType),
+            th.Property("channel_name", th.StringType),
+            th.Property("channel_id", th.IntegerType),
+            th.Property("api_id", th.IntegerType),
+            th.Property("payment_id", th.StringType),
+            th.Property("price_total", th.NumberType),
+            th.Property("price_currency", th.StringType),
+            th.Property("discount_total", th.NumberType),
+            th.Property("vat_number", th.StringType),
+            th.Property("total_weight", th.NumberType),
+            *_address_properties("billing", _BILLING_ADDRESS_FIELDS),
+            *_address_properties("shipping", _SHIPPING_ADDRESS_FIELDS),
+            th.Property("shipping_service", th.StringType),
+            th.Property("order_status", th.StringType),
+            th.Property("order_date", th.DateTimeType),
+            th.Property("ship_on_date", th.BooleanType),
+            th.Property("sync_date", th.DateTimeType),
+            th.Property("updated_at", th.DateTimeType),
+            th.Property("batch_id", th.IntegerType),
+            th.Property("batch_title", th.StringType),
+            th.Property("packaging_id", th.IntegerType),
+            th.Property("order_products", th.StringType),
+            th.Property("extra_comment", th.StringType),
+        ).to_dict()
 
     def get_url_params(
         self,
         context: Context | None,
         next_page_token: int | None,
     ) -> dict[str, t.Any]:
-        params: dict[str, t.Any] = {
-            "page": next_page_token or 1,
-            "order_status": "ALL",
-            "sort_attr": "updated_at",
-            "sort_dir": "asc",
-        }
-
-        bookmark_value = self.get_starting_replication_key_value(context)
+        params = dict(self._static_params)
+        params["page"] = next_page_token or 1
+
+        bookmark_value = self._get_bookmark(context)
         if bookmark_value:
             params["updated_at_from"] = bookmark_value
-            self.logger.info(f"[{self.name}] updated_at_from: {bookmark_value}")
+            self.logger.info("[%s] updated_at_from: %s", self.name, bookmark_value)
 
-        self._current_end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        params["updated_at_to"] = self._current_end_date
-        self.logger.info(f"[{self.name}] updated_at_to: {self._current_end_date}")
+        end_date = self._get_end_date()
+        params["updated_at_to"] = end_date
+        self.logger.info("[%s] updated_at_to: %s", self.name, end_date)
 
         return params
 
-    def post_process(
-        self,
-        row: dict,
-        context: Context | None = None,
-    ) -> dict | None:
-        if not row:
-            return None
-
-        for field in ["order_products"]:
-            if field in row and isinstance(row[field], (list, dict)):
-                row[field] = json.dumps(row[field])
-            elif field not in row:
-                row[field] = None
-
-        return row
-
-    def get_replication_key_signpost(
-        self,
-        context: Context | None = None,
-    ) -> str | None:
-        return self._current_end_date
 
 class InboundDeliveriesStream(ChanneldockStream):
     """Deliveries stream with updated_at incremental sync."""
@@ -260,74 +229,53 @@ class InboundDeliveriesStream(ChanneldockStream):
     primary_keys = ["id"]
     replication_key = "updated_at"
     replication_method = "INCREMENTAL"
-    records_jsonpath = "$.deliveries[*]"
-
-    _current_end_date: str | None = None
-
-    schema = th.PropertiesList(
-        th.Property("id", th.IntegerType, required=True),
-        th.Property("delivery_type", th.StringType),
-        th.Property("ref", th.StringType),
-        th.Property("status", th.StringType),
-        th.Property("delivery_date", th.DateType),
-        th.Property("stocked_at", th.DateTimeType),
-        th.Property("created_at", th.DateTimeType),
-        th.Property("updated_at", th.DateTimeType),
-        th.Property("pallets", th.IntegerType),
-        th.Property("boxes", th.IntegerType),
-        th.Property("supplier_id", th.IntegerType),
-        th.Property("supplier", th.StringType),
-        th.Property("center_id", th.IntegerType),
-        th.Property("extra_description", th.StringType),
-        th.Property("items", th.StringType),
-    ).to_dict()
+    records_key = "deliveries"
+    _json_fields = ("supplier", "items")
+    _BASE_PARAMS = {
+        "sort_attr": "updated_at",
+        "sort_dir": "ASC",
+        "delivery_type": "inbound",
+    }
+
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return th.PropertiesList(
+            th.Property("id", th.IntegerType, required=True),
+            th.Property("delivery_type", th.StringType),
+            th.Property("ref", th.StringType),
+            th.Property("status", th.StringType),
+            th.Property("delivery_date", th.DateType),
+            th.Property("stocked_at", th.DateTimeType),
+            th.Property("created_at", th.DateTimeType),
+            th.Property("updated_at", th.DateTimeType),
+            th.Property("pallets", th.IntegerType),
+            th.Property("boxes", th.IntegerType),
+            th.Property("supplier_id", th.IntegerType),
+            th.Property("supplier", th.StringType),
+            th.Property("center_id", th.IntegerType),
+            th.Property("extra_description", th.StringType),
+            th.Property("items", th.StringType),
+        ).to_dict()
 
     def get_url_params(
         self,
         context: Context | None,
         next_page_token: int | None,
     ) -> dict[str, t.Any]:
-        params: dict[str, t.Any] = {
-            "page": next_page_token or 1,
-            "sort_attr": "updated_at",
-            "sort_dir": "ASC",
-        }
+        params = dict(self._static_params)
+        params["page"] = next_page_token or 1
 
-        bookmark_value = self.get_starting_replication_key_value(context)
+        bookmark_value = self._get_bookmark(context)
         if bookmark_value:
             params["updated_at"] = bookmark_value
-            self.logger.info(f"[{self.name}] updated_at: {bookmark_value}")
+            self.logger.info("[%s] updated_at: %s", self.name, bookmark_value)
 
-        params["delivery_type"] = "inbound"
-        self.logger.info(f"[{self.name}] delivery_type: inbound")
+        self.logger.info("[%s] delivery_type: inbound", self.name)
 
-        self._current_end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{self.name}] end_date: {self._current_end_date}")
+        self.logger.info("[%s] end_date: %s", self.name, self._get_end_date())
 
         return params
 
-    def post_process(
-        self,
-        row: dict,
-        context: Context | None = None,
-    ) -> dict | None:
-        if not row:
-            return None
-
-        for field in ["supplier", "items"]:
-            if field in row and isinstance(row[field], (list, dict)):
-                row[field] = json.dumps(row[field])
-            elif field not in row:
-                row[field] = None
-
-        return row
-
-    def get_replication_key_signpost(
-        self,
-        context: Context | None = None,
-    ) -> str | None:
-        return self._current_end_date
-
 
 class OutboundDeliveriesStream(ChanneldockStream):
     """Deliveries stream with updated_at incremental sync."""
@@ -337,70 +285,49 @@ class OutboundDeliveriesStream(ChanneldockStream):
     primary_keys = ["id"]
     replication_key = "updated_at"
     replication_method = "INCREMENTAL"
-    records_jsonpath = "$.deliveries[*]"
-
-    _current_end_date: str | None = None
-
-    schema = th.PropertiesList(
-        th.Property("id", th.IntegerType, required=True),
-        th.Property("delivery_type", th.StringType),
-        th.Property("ref", th.StringType),
-        th.Property("status", th.StringType),
-        th.Property("delivery_date", th.DateType),
-        th.Property("stocked_at", th.DateTimeType),
-        th.Property("created_at", th.DateTimeType),
-        th.Property("updated_at", th.DateTimeType),
-        th.Property("pallets", th.IntegerType),
-        th.Property("boxes", th.IntegerType),
-        th.Property("supplier_id", th.IntegerType),
-        th.Property("supplier", th.StringType),
-        th.Property("center_id", th.IntegerType),
-        th.Property("extra_description", th.StringType),
-        th.Property("items", th.StringType),
-    ).to_dict()
+    records_key = "deliveries"
+    _json_fields = ("supplier", "items")
+    _BASE_PARAMS = {
+        "sort_attr": "updated_at",
+        "sort_dir": "ASC",
+        "delivery_type": "outbound",
+    }
+
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return th.PropertiesList(
+            th.Property("id", th.IntegerType, required=True),
+            th.Property("delivery_type", th.StringType),
+            th.Property("ref", th.StringType),
+            th.Property("status", th.StringType),
+            th.Property("delivery_date", th.DateType),
+            th.Property("stocked_at", th.DateTimeType),
+            th.Property("created_at", th.DateTimeType),
+            th.Property("updated_at", th.DateTimeType),
+            th.Property("pallets", th.IntegerType),
+            th.Property("boxes", th.IntegerType),
+            th.Property("supplier_id", th.IntegerType),
+            th.Property("supplier", th.StringType),
+            th.Property("center_id", th.IntegerType),
+            th.Property("extra_description", th.StringType),
+            th.Property("items", th.StringType),
+        ).to_dict()
 
     def get_url_params(
         self,
         context: Context | None,
         next_page_token: int | None,
     ) -> dict[str, t.Any]:
-        params: dict[str, t.Any] = {
-            "page": next_page_token or 1,
-            "sort_attr": "updated_at",
-            "sort_dir": "ASC",
-        }
+        params = dict(self._static_params)
+        params["page"] = next_page_token or 1
 
-        bookmark_value = self.get_starting_replication_key_value(context)
+        bookmark_value = self._get_bookmark(context)
         if bookmark_value:
             params["updated_at"] = bookmark_value
-            self.logger.info(f"[{self.name}] updated_at: {bookmark_value}")
+            self.logger.info("[%s] updated_at: %s", self.name, bookmark_value)
 
-        params["delivery_type"] = "outbound"
-        self.logger.info(f"[{self.name}] delivery_type: outbound")
+        self.logger.info("[%s] delivery_type: outbound", self.name)
 
-        self._current_end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{self.name}] end_date: {self._current_end_date}")
+        self.logger.info("[%s] end_date: %s", self.name, self._get_end_date())
 
         return params
-
-    def post_process(
-        self,
-        row: dict,
-        context: Context | None = None,
-    ) -> dict | None:
-        if not row:
-            return None
-
-        for field in ["supplier", "items"]:
-            if field in row and isinstance(row[field], (list, dict)):
-                row[field] = json.dumps(row[field])
-            elif field not in row:
-                row[field] = None
-
-        return row
-
-    def get_replication_key_signpost(
-        self,
-        context: Context | None = None,
-    ) -> str | None:
-        return self._current_end_date
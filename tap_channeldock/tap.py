@@ -1,10 +1,11 @@
 """Channeldock tap class."""
 
-from typing import List
+from typing import List, Type
 
 from singer_sdk import Stream, Tap
 from singer_sdk import typing as th
 
+from tap_channeldock.client import ChanneldockStream
 from tap_channeldock.streams import (
     InboundDeliveriesStream,
     OutboundDeliveriesStream,
@@ -13,7 +14,7 @@ from tap_channeldock.streams import (
     SuppliersStream,
 )
 
-STREAM_TYPES = [
+STREAM_TYPES: List[Type[ChanneldockStream]] = [
     ProductsStream,
     SuppliersStream,
     OrdersStream,
@@ -42,7 +43,32 @@ class TapChanneldock(Tap):
             "start_date",
             th.DateTimeType,
             description="The earliest date to sync data from (ISO 8601 format)",
-        )
+        ),
+        th.Property(
+            "response_cache_ttl",
+            th.IntegerType,
+            description=(
+                "Seconds to cache full-table GET responses on disk "
+                "(.channeldock_cache); disabled when unset or 0"
+            ),
+        ),
+        th.Property(
+            "max_concurrency",
+            th.IntegerType,
+            description=(
+                "Number of pages to request in parallel per stream (default 1). "
+                "Pages past the last one may be requested and discarded"
+            ),
+        ),
+        th.Property(
+            "page_size",
+            th.IntegerType,
+            description=(
+                "Records per page, sent as per_page. Leave unset to use the "
+                "API default of 50. If the API returns fewer per page, a "
+                "warning is logged and pagination continues at that size"
+            ),
+        ),
     ).to_dict()
 
     def discover_streams(self) -> List[Stream]:
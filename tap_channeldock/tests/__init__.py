@@ -0,0 +1 @@
+"""Test suite for tap-channeldock."""
@@ -0,0 +1,34 @@
+"""Shared fixtures for tap-channeldock tests."""
+
+import json
+
+import pytest
+import requests
+
+from tap_channeldock.tap import TapChanneldock
+
+CONFIG = {"api_key": "key", "api_secret": "secret"}
+
+
+@pytest.fixture
+def make_tap():
+    """Build a tap from the base config plus overrides."""
+
+    def _make_tap(**config):
+        return TapChanneldock(config={**CONFIG, **config}, parse_env_config=False)
+
+    return _make_tap
+
+
+@pytest.fixture
+def make_response():
+    """Build a response with a JSON body, as the transport would return it."""
+
+    def _make_response(body=None, status=200, headers=None):
+        response = requests.Response()
+        response.status_code = status
+        response._content = b"" if body is None else json.dumps(body).encode()
+        response.headers.update(headers or {})
+        return response
+
+    return _make_response
@@ -0,0 +1,63 @@
+"""Tests for ChanneldockPaginator page-end detection."""
+
+import logging
+
+import pytest
+
+from tap_channeldock.client import ChanneldockPaginator
+
+
+@pytest.fixture
+def page(make_response):
+    def _page(n):
+        return make_response({"suppliers_count": n, "suppliers": [{"id": 1}] * n})
+
+    return _page
+
+
+def _pages_requested(paginator, page, sizes):
+    """Feed pages of ``sizes`` records until the paginator stops."""
+    requested = [paginator.current_value]
+    for size in sizes:
+        paginator.advance(page(size))
+        if paginator.finished:
+            break
+        requested.append(paginator.current_value)
+    return requested
+
+
+def test_short_page_ends_pagination_at_default_size(page):
+    paginator = ChanneldockPaginator("suppliers")
+
+    assert _pages_requested(paginator, page, [50, 50, 20]) == [1, 2, 3]
+
+
+def test_empty_page_ends_pagination(page):
+    paginator = ChanneldockPaginator("suppliers")
+
+    assert _pages_requested(paginator, page, [50, 0]) == [1, 2]
+
+
+def test_capped_page_size_keeps_paginating(page, caplog):
+    paginator = ChanneldockPaginator("suppliers", page_size=100, verify_page_size=True)
+
+    with caplog.at_level(logging.WARNING):
+        requested = _pages_requested(paginator, page, [50, 50, 20])
+
+    assert requested == [1, 2, 3]
+    assert "instead of the configured page_size of 100" in caplog.text
+
+
+def test_confirmed_page_size_ends_on_short_page(page, caplog):
+    paginator = ChanneldockPaginator("suppliers", page_size=100, verify_page_size=True)
+
+    requested = _pages_requested(paginator, page, [100, 20])
+
+    assert requested == [1, 2]
+    assert caplog.text == ""
+
+
+def test_single_short_page_is_confirmed_by_an_empty_page(page):
+    paginator = ChanneldockPaginator("suppliers", page_size=100, verify_page_size=True)
+
+    assert _pages_requested(paginator, page, [20, 0]) == [1, 2]
@@ -0,0 +1,49 @@
+"""Tests for encoding nested fields in post_process."""
+
+import pytest
+
+from tap_channeldock import client
+
+
+@pytest.fixture
+def deliveries(make_tap):
+    return make_tap().streams["inbound_deliveries"]
+
+
+def test_lists_and_objects_are_encoded_as_json(deliveries):
+    row = {"id": 1, "supplier": {"name": "ACME"}, "items": [{"sku": "A"}]}
+
+    assert deliveries.post_process(row) == {
+        "id": 1,
+        "supplier": '{"name":"ACME"}',
+        "items": '[{"sku":"A"}]',
+    }
+
+
+def test_scalars_pass_through_unchanged(deliveries):
+    row = {"id": 1, "supplier": "ACME", "items": None}
+
+    assert deliveries.post_process(row) == {"id": 1, "supplier": "ACME", "items": None}
+
+
+def test_missing_fields_are_set_to_none(deliveries):
+    assert deliveries.post_process({"id": 1}) == {
+        "id": 1,
+        "supplier": None,
+        "items": None,
+    }
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"name": "Café Ä", "tags": ["ß", "東京"]},
+        [{"sku": "A", "qty": 2, "price": 1.5, "ok": True, "note": None}],
+        {"1": {"nested": []}},
+    ],
+)
+def test_output_does_not_depend_on_orjson(value, monkeypatch):
+    with_orjson = client._dumps(value)
+    monkeypatch.setattr(client, "orjson", None)
+
+    assert client._dumps(value) == with_orjson
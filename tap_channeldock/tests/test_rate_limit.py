@@ -0,0 +1,87 @@
+"""Tests for the token-bucket rate limiter."""
+
+import threading
+
+import pytest
+
+from tap_channeldock import client
+from tap_channeldock.client import RATE_LIMIT_PER_HOUR, TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only moves when slept on or advanced."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(client.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(client.time, "sleep", fake.sleep)
+    return fake
+
+
+def test_acquire_does_not_block_while_tokens_remain(clock):
+    bucket = TokenBucket(capacity=3, refill_rate=1.0)
+
+    for _ in range(3):
+        bucket.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_acquire_waits_for_the_missing_token(clock):
+    bucket = TokenBucket(capacity=2, refill_rate=0.5)
+    bucket.acquire()
+    bucket.acquire()
+
+    bucket.acquire()
+
+    assert clock.sleeps == [pytest.approx(2.0)]
+    assert bucket.tokens == pytest.approx(0.0)
+
+
+def test_acquire_gives_up_without_a_token_once_stopped(clock):
+    bucket = TokenBucket(capacity=1, refill_rate=0.5)
+    bucket.acquire()
+    stop = threading.Event()
+    stop.set()
+
+    assert bucket.acquire(stop=stop) is False
+    assert clock.sleeps == []
+    assert bucket.tokens == pytest.approx(0.0)
+
+
+def test_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(capacity=2, refill_rate=1.0)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 100
+    bucket.acquire()
+
+    assert clock.sleeps == []
+    assert bucket.tokens == pytest.approx(1.0)
+
+
+def test_shared_bucket_stays_within_the_hourly_limit(clock, monkeypatch):
+    monkeypatch.setattr(client, "_BUCKETS", {})
+    bucket = client.get_bucket("key")
+
+    sent_in_first_hour = 0
+    for _ in range(RATE_LIMIT_PER_HOUR + 100):
+        bucket.acquire()
+        if clock.now < 3600:
+            sent_in_first_hour += 1
+
+    assert sent_in_first_hour <= RATE_LIMIT_PER_HOUR
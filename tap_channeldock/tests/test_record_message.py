@@ -0,0 +1,53 @@
+"""Tests for encoding RECORD messages in _format_record_message."""
+
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+from singer_sdk._singerlib.messages import RecordMessage, format_message
+
+from tap_channeldock.client import _format_record_message
+
+EXTRACTED_AT = datetime.datetime(2024, 6, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+def _message(record):
+    return RecordMessage(stream="orders", record=record, time_extracted=EXTRACTED_AT)
+
+
+def _loads(text):
+    # Decimals must keep their exact value, not round-trip through float
+    return json.loads(text, parse_float=Decimal)
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        {"id": 1, "ref": "A-1", "total": 9.5, "paid": True, "note": None},
+        {"id": 1, "order_products": '[{"sku":"A"}]'},
+        {"id": 1, "updated_at": datetime.datetime(2024, 6, 1, 11, 30)},
+        {"id": 1, "date": datetime.date(2024, 6, 1)},
+    ],
+)
+def test_same_json_as_the_sdk(record):
+    message = _message(record)
+
+    assert _loads(_format_record_message(message)) == _loads(format_message(message))
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        # Written as numbers by the SDK encoder
+        {"id": 1, "total": Decimal("12345678901234567890.123456789")},
+        # Escaped by the SDK encoder
+        {"id": 1, "name": "Café Ä 東京"},
+        # Too large for orjson
+        {"id": 2**64 + 1},
+    ],
+)
+def test_falls_back_to_the_sdk_encoder(record):
+    message = _message(record)
+
+    assert _format_record_message(message) == format_message(message)
@@ -0,0 +1,201 @@
+"""Tests for concurrent page prefetching in request_records."""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+from singer_sdk.exceptions import FatalAPIError, RetriableAPIError
+
+from tap_channeldock import client
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+class FakeAPI:
+    """Serves ``total`` suppliers, 50 per page, from RESTStream._request."""
+
+    def __init__(self, make_response) -> None:
+        self.make_response = make_response
+        self.total = 120
+        self.delays = {}
+        self.errors = {}
+        self.attempts = Counter()
+        self._lock = threading.Lock()
+
+    def request(self, prepared_request):
+        query = dict(parse_qsl(urlsplit(prepared_request.url).query))
+        page = int(query["page"])
+        with self._lock:
+            self.attempts[page] += 1
+        time.sleep(self.delays.get(page, 0))
+        if page in self.errors:
+            raise self.errors[page]
+
+        first = (page - 1) * 50 + 1
+        ids = range(first, min(first + 49, self.total) + 1)
+        return self.make_response(
+            {"suppliers_count": len(ids), "suppliers": [{"id": i} for i in ids]}
+        )
+
+
+@pytest.fixture(autouse=True)
+def fresh_buckets(monkeypatch):
+    monkeypatch.setattr(client, "_BUCKETS", {})
+
+
+@pytest.fixture
+def api(monkeypatch, make_response):
+    fake = FakeAPI(make_response)
+    monkeypatch.setattr(
+        client.RESTStream,
+        "_request",
+        lambda stream, prepared_request, context: fake.request(prepared_request),
+    )
+    return fake
+
+
+@pytest.fixture
+def suppliers(make_tap):
+    stream = make_tap(max_concurrency=4).streams["suppliers"]
+
+    def wait_generator():
+        yield
+        while True:
+            yield 1.0
+
+    stream.backoff_wait_generator = wait_generator
+    return stream
+
+
+def _ids(records):
+    return [record["id"] for record in records]
+
+
+def test_records_are_yielded_in_page_order(api, suppliers):
+    api.total = 220
+    api.delays = {2: 0.2, 3: 0.1}
+
+    records = list(suppliers.request_records(None))
+
+    assert _ids(records) == list(range(1, 221))
+
+
+def test_pagination_ends_after_a_short_page(api, suppliers):
+    records = list(suppliers.request_records(None))
+
+    assert _ids(records) == list(range(1, 121))
+    # Page 1 alone, then at most one window of speculative pages
+    assert max(api.attempts) <= 3 + 4
+    assert all(count == 1 for count in api.attempts.values())
+
+
+def test_failing_speculative_page_does_not_block_the_sync(api, suppliers):
+    api.errors = {
+        page: RetriableAPIError(f"503 Server Error: page {page}") for page in (4, 5)
+    }
+
+    started = time.monotonic()
+    records = list(suppliers.request_records(None))
+
+    assert _ids(records) == list(range(1, 121))
+    assert time.monotonic() - started < 0.5
+
+
+# Syncs three pages while pages 4 and 5 fail and back off for 5 seconds,
+# then exits. The interpreter joins executor workers at exit.
+BACKOFF_AT_EXIT_SCRIPT = """
+import json
+
+import requests
+from singer_sdk.exceptions import RetriableAPIError
+
+from tap_channeldock import client
+from tap_channeldock.tap import TapChanneldock
+
+
+def fake_request(stream, prepared_request, context):
+    query = client.urlsplit(prepared_request.url).query
+    page = int(dict(client.parse_qsl(query))["page"])
+    if page > 3:
+        raise RetriableAPIError("503 Server Error")
+    response = requests.Response()
+    response.status_code = 200
+    count = 50 if page < 3 else 20
+    response._content = json.dumps(
+        {"suppliers_count": count, "suppliers": [{"id": 1}] * count}
+    ).encode()
+    return response
+
+
+def wait_generator():
+    yield
+    while True:
+        yield 5.0
+
+
+client.RESTStream._request = fake_request
+tap = TapChanneldock(
+    config={"api_key": "key", "api_secret": "secret", "max_concurrency": 4},
+    parse_env_config=False,
+)
+stream = tap.streams["suppliers"]
+stream.backoff_wait_generator = wait_generator
+list(stream.request_records(None))
+print("synced", flush=True)
+"""
+
+
+def test_backoff_wait_does_not_delay_process_exit():
+    process = subprocess.Popen(
+        [sys.executable, "-c", BACKOFF_AT_EXIT_SCRIPT],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        assert process.stdout.readline() == "synced\n"
+        synced = time.monotonic()
+        assert process.wait(timeout=10) == 0
+    finally:
+        process.kill()
+        process.stdout.close()
+
+    assert time.monotonic() - synced < 2
+
+
+def test_page_discarded_while_waiting_for_a_token_is_never_sent(
+    api, suppliers, monkeypatch
+):
+    # Tokens for pages 1 and 2 only; pages 3-5 wait a second for theirs
+    bucket = client.TokenBucket(capacity=2, refill_rate=1.0)
+    monkeypatch.setattr(client, "_BUCKETS", {"key": bucket})
+    api.total = 70
+    workers_before = set(threading.enumerate())
+
+    started = time.monotonic()
+    records = list(suppliers.request_records(None))
+
+    assert _ids(records) == list(range(1, 71))
+    assert time.monotonic() - started < 0.5
+    # Once the workers have exited, no discarded page has been sent
+    for thread in set(threading.enumerate()) - workers_before:
+        thread.join(timeout=5)
+    assert sorted(api.attempts) == [1, 2]
+
+
+def test_error_does_not_wait_for_pages_in_flight(api, suppliers):
+    api.total = 300
+    api.errors = {2: FatalAPIError("404 Client Error")}
+    api.delays = {3: 1.0, 4: 1.0, 5: 1.0}
+
+    started = time.monotonic()
+    with pytest.raises(FatalAPIError):
+        list(suppliers.request_records(None))
+
+    assert time.monotonic() - started < 0.5
@@ -0,0 +1,184 @@
+"""Tests for the on-disk response cache used by full-table streams."""
+
+import pytest
+import requests
+from singer_sdk.exceptions import RetriableAPIError
+
+from tap_channeldock import client
+from tap_channeldock.client import STALE_IF_ERROR_TTL_FACTOR, ResponseCache
+
+SUPPLIERS_PAGE = {"suppliers_count": 1, "suppliers": [{"id": 1}]}
+
+
+@pytest.fixture
+def now(monkeypatch):
+    """Wall clock for cache timestamps; advance it with ``now[0] += s``."""
+    clock = [1_000_000.0]
+    monkeypatch.setattr(client.time, "time", lambda: clock[0])
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def cache_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "responses.sqlite")
+    monkeypatch.setattr(client, "RESPONSE_CACHE_PATH", path)
+    monkeypatch.setattr(client, "_RESPONSE_CACHES", {})
+    return path
+
+
+@pytest.fixture
+def suppliers(make_tap, monkeypatch):
+    """Suppliers stream whose sends are answered from ``suppliers.replies``."""
+    stream = make_tap(response_cache_ttl=60).streams["suppliers"]
+    stream.replies = []
+    stream.sent = []
+
+    def fake_send(prepared_request, context):
+        stream.sent.append(prepared_request)
+        reply = stream.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    def wait_generator():
+        yield
+        while True:
+            yield 0
+
+    monkeypatch.setattr(stream, "_send", fake_send)
+    stream.backoff_wait_generator = wait_generator
+    return stream
+
+
+def _get(stream):
+    """Request page 1 as request_records does, retries included."""
+    prepared_request = stream.prepare_request(None, next_page_token=1)
+    decorated_request = stream.request_decorator(stream._request)
+    return stream._request_or_stale(decorated_request, prepared_request, None)
+
+
+def _records(stream, response):
+    return list(stream.parse_response(response))
+
+
+def test_keys_are_isolated_per_api_key(suppliers, cache_path, make_response, now):
+    prepared_request = suppliers.prepare_request(None, next_page_token=1)
+    cache = ResponseCache(cache_path, ttl=60)
+    key_a = cache.key_for(prepared_request, "key-a")
+    key_b = cache.key_for(prepared_request, "key-b")
+    cache.set(key_a, make_response(SUPPLIERS_PAGE))
+
+    assert key_a != key_b
+    assert cache.get(key_a, prepared_request) is not None
+    assert cache.get(key_b, prepared_request) is None
+
+
+def test_entries_expire_after_ttl(suppliers, cache_path, make_response, now):
+    prepared_request = suppliers.prepare_request(None, next_page_token=1)
+    cache = ResponseCache(cache_path, ttl=60)
+    key = cache.key_for(prepared_request, "key")
+    cache.set(key, make_response(SUPPLIERS_PAGE))
+
+    now[0] += 61
+
+    assert cache.get(key, prepared_request) is None
+    assert cache.get(key, prepared_request, max_age=float("inf")) is not None
+
+
+def test_fresh_entry_is_served_without_a_request(suppliers, make_response, now):
+    suppliers.replies = [make_response(SUPPLIERS_PAGE)]
+
+    _get(suppliers)
+    response = _get(suppliers)
+
+    assert len(suppliers.sent) == 1
+    assert _records(suppliers, response) == [{"id": 1}]
+
+
+def test_not_modified_replays_the_cached_body(suppliers, make_response, now):
+    suppliers.replies = [
+        make_response(SUPPLIERS_PAGE, headers={"ETag": '"v1"'}),
+        make_response(status=304),
+    ]
+    _get(suppliers)
+    now[0] += 61
+
+    response = _get(suppliers)
+
+    assert suppliers.sent[1].headers["If-None-Match"] == '"v1"'
+    assert _records(suppliers, response) == [{"id": 1}]
+    # The revalidated entry is fresh again
+    _get(suppliers)
+    assert len(suppliers.sent) == 2
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        RetriableAPIError("503 Server Error"),
+        requests.exceptions.ConnectionError(),
+        requests.exceptions.ReadTimeout(),
+    ],
+)
+def test_failed_request_falls_back_to_stale_entry_after_retries(
+    suppliers, make_response, now, error
+):
+    tries = suppliers.backoff_max_tries()
+    suppliers.replies = [make_response(SUPPLIERS_PAGE)] + [error] * tries
+    _get(suppliers)
+    now[0] += 61
+
+    response = _get(suppliers)
+
+    assert len(suppliers.sent) == 1 + tries
+    assert _records(suppliers, response) == [{"id": 1}]
+
+
+def test_transient_error_is_retried_before_serving_stale(
+    suppliers, make_response, now
+):
+    suppliers.replies = [
+        make_response(SUPPLIERS_PAGE),
+        RetriableAPIError("503 Server Error"),
+        make_response({"suppliers_count": 1, "suppliers": [{"id": 2}]}),
+    ]
+    _get(suppliers)
+    now[0] += 61
+
+    response = _get(suppliers)
+
+    assert _records(suppliers, response) == [{"id": 2}]
+
+
+def test_failed_request_does_not_serve_a_too_old_entry(
+    suppliers, make_response, now
+):
+    tries = suppliers.backoff_max_tries()
+    error = requests.exceptions.ReadTimeout()
+    suppliers.replies = [make_response(SUPPLIERS_PAGE)] + [error] * tries
+    _get(suppliers)
+    now[0] += 60 * STALE_IF_ERROR_TTL_FACTOR + 1
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        _get(suppliers)
+
+
+def test_failed_request_without_entry_raises(suppliers):
+    tries = suppliers.backoff_max_tries()
+    suppliers.replies = [requests.exceptions.ReadTimeout()] * tries
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        _get(suppliers)
+
+
+def test_api_error_bodies_are_not_cached(suppliers, make_response, now):
+    suppliers.replies = [
+        make_response({"response": "error", "message": "Invalid api key"}),
+        make_response(SUPPLIERS_PAGE),
+    ]
+
+    _get(suppliers)
+    response = _get(suppliers)
+
+    assert len(suppliers.sent) == 2
+    assert _records(suppliers, response) == [{"id": 1}]
@@ -0,0 +1,102 @@
+"""Tests for Retry-After parsing and the backoff wait schedule."""
+
+import time
+from email.utils import formatdate
+
+import backoff
+import pytest
+
+from tap_channeldock import client
+from tap_channeldock.client import (
+    BACKOFF_BASE_SECONDS,
+    BACKOFF_CAP_SECONDS,
+    _retry_after_seconds,
+)
+
+
+@pytest.fixture
+def retry_after(make_response):
+    def _retry_after(**headers):
+        return _retry_after_seconds(make_response(status=429, headers=headers))
+
+    return _retry_after
+
+
+def test_delta_seconds(retry_after):
+    assert retry_after(**{"Retry-After": "120"}) == 120.0
+
+
+def test_http_date(retry_after):
+    retry_at = formatdate(time.time() + 90, usegmt=True)
+
+    assert retry_after(**{"Retry-After": retry_at}) == pytest.approx(90, abs=2)
+
+
+def test_falls_back_to_rate_limit_reset(retry_after):
+    reset_at = str(int(time.time()) + 30)
+
+    assert retry_after(**{"X-RateLimit-Reset": reset_at}) == pytest.approx(30, abs=2)
+
+
+def test_garbage_retry_after_falls_back_to_rate_limit_reset(retry_after):
+    reset_at = str(int(time.time()) + 30)
+
+    assert retry_after(
+        **{"Retry-After": "soon", "X-RateLimit-Reset": reset_at}
+    ) == pytest.approx(30, abs=2)
+
+
+@pytest.mark.parametrize(
+    "garbage",
+    [
+        {},
+        {"Retry-After": "soon"},
+        {"X-RateLimit-Reset": "tomorrow"},
+        {"Retry-After": "soon", "X-RateLimit-Reset": "tomorrow"},
+    ],
+)
+def test_missing_or_garbage_headers(retry_after, garbage):
+    assert retry_after(**garbage) is None
+
+
+@pytest.fixture
+def stream(make_tap, monkeypatch):
+    # Always wait the full ceiling so the schedule is deterministic
+    monkeypatch.setattr(client.random, "uniform", lambda low, high: high)
+    return make_tap().streams["suppliers"]
+
+
+def test_wait_generator_is_primed_then_doubles_up_to_the_cap(stream):
+    waits = stream.backoff_wait_generator()
+
+    assert next(waits) is None
+    assert [next(waits) for _ in range(5)] == [
+        BACKOFF_BASE_SECONDS,
+        BACKOFF_BASE_SECONDS * 2,
+        BACKOFF_BASE_SECONDS * 4,
+        BACKOFF_CAP_SECONDS,
+        BACKOFF_CAP_SECONDS,
+    ]
+
+
+def test_backoff_sleeps_follow_the_schedule(stream, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    calls = []
+
+    @backoff.on_exception(
+        stream.backoff_wait_generator,
+        ValueError,
+        max_tries=3,
+        jitter=stream.backoff_jitter,
+    )
+    def flaky():
+        calls.append(1)
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        flaky()
+
+    assert len(calls) == 3
+    # The priming value is not used as a wait
+    assert sleeps == [BACKOFF_BASE_SECONDS, BACKOFF_BASE_SECONDS * 2]
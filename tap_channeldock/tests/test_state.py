@@ -0,0 +1,93 @@
+"""Tests for the sync window and the bookmarks written to STATE."""
+
+import json
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from tap_channeldock import client
+
+END_DATE = "2024-06-01 12:00:00"
+# The second record was updated while the sync was running
+UPDATED_AT = ["2024-06-01 11:00:00", "2024-06-01 12:30:00"]
+
+
+@pytest.fixture(autouse=True)
+def fresh_buckets(monkeypatch):
+    monkeypatch.setattr(client, "_BUCKETS", {})
+
+
+@pytest.fixture
+def sent(monkeypatch, make_response):
+    """Query params of every page sent; each stream gets one page back."""
+    params = []
+
+    def fake_request(stream, prepared_request, context):
+        params.append(dict(parse_qsl(urlsplit(prepared_request.url).query)))
+        records = [
+            {"id": i, stream.replication_key: value}
+            for i, value in enumerate(UPDATED_AT, start=1)
+        ]
+        return make_response(
+            {f"{stream.records_key}_count": len(records), stream.records_key: records}
+        )
+
+    monkeypatch.setattr(client.RESTStream, "_request", fake_request)
+    monkeypatch.setattr(
+        client.ChanneldockStream, "_utcnow_str", staticmethod(lambda: END_DATE)
+    )
+    return params
+
+
+def _final_bookmark(stream, capsys):
+    stream.sync()
+    states = [
+        json.loads(line)["value"]
+        for line in capsys.readouterr().out.splitlines()
+        if json.loads(line)["type"] == "STATE"
+    ]
+    return states[-1]["bookmarks"][stream.name]
+
+
+def test_bookmark_is_capped_at_the_end_date_sent(make_tap, sent, capsys):
+    orders = make_tap().streams["orders"]
+
+    bookmark = _final_bookmark(orders, capsys)
+
+    assert sent[0]["updated_at_to"] == END_DATE
+    assert bookmark["replication_key_value"] == END_DATE
+
+
+def test_bookmark_is_not_capped_when_no_end_date_is_sent(make_tap, sent, capsys):
+    deliveries = make_tap().streams["inbound_deliveries"]
+
+    bookmark = _final_bookmark(deliveries, capsys)
+
+    assert "end_date" not in sent[0]
+    assert bookmark["replication_key_value"] == UPDATED_AT[-1]
+    assert "replication_key_signpost" not in bookmark
+
+
+def test_signpost_has_no_side_effects(make_tap, sent):
+    tap = make_tap()
+    orders = tap.streams["orders"]
+    deliveries = tap.streams["inbound_deliveries"]
+
+    assert orders.get_replication_key_signpost(None) is None
+    assert orders.get_replication_key_signpost(None) is None
+    assert orders._current_end_date is None
+    assert deliveries.get_replication_key_signpost(None) is None
+
+
+def test_each_sync_starts_a_new_window(make_tap, sent, monkeypatch, capsys):
+    orders = make_tap().streams["orders"]
+    orders.sync()
+    next_day = "2024-06-02 12:00:00"
+    monkeypatch.setattr(
+        client.ChanneldockStream, "_utcnow_str", staticmethod(lambda: next_day)
+    )
+
+    orders.sync()
+    capsys.readouterr()
+
+    assert [params["updated_at_to"] for params in sent] == [END_DATE, next_day]